@@ -0,0 +1,16 @@
+"""
+Shared click parameter types.
+
+click.Path converters hold no per-call state, so every command reuses the
+same instances instead of building a new one for each decorator.
+"""
+
+from pathlib import Path
+
+import click
+
+# Existing file or directory, converted to a Path
+PATH_IN = click.Path(exists=True, path_type=Path)
+
+# Any file or directory path (may not exist yet), converted to a Path
+PATH_OUT = click.Path(path_type=Path)
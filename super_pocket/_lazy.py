@@ -0,0 +1,35 @@
+"""
+Lazy helpers for CLI startup.
+
+Provides a console proxy that only imports and builds a Rich console when a
+command actually prints something.
+"""
+
+import importlib
+
+
+class LazyConsole:
+    """
+    Stand-in for rich.console.Console created on first attribute access.
+
+    Building a Console probes the terminal (size, color support, environment)
+    and importing rich pulls in a large module graph. Modules that create
+    their console at import time use this proxy so that commands which never
+    print don't pay for either.
+
+    Example:
+        >>> console = LazyConsole()
+        >>> console.print("[green]Done[/green]")  # Console built here
+    """
+
+    __slots__ = ('_console',)
+
+    def __init__(self):
+        self._console = None
+
+    def __getattr__(self, name):
+        console = self._console
+        if console is None:
+            console = importlib.import_module('rich.console').Console()
+            self._console = console
+        return getattr(console, name)
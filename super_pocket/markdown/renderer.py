@@ -17,6 +17,8 @@ from rich.console import Console
 from rich.markdown import Markdown
 from rich import errors
 
+from super_pocket._click_types import PATH_IN, PATH_OUT
+
 
 def read_markdown_file(file_path: Path) -> str:
     """
@@ -73,25 +75,30 @@ def render_markdown(content: str, console: Optional[Console] = None) -> None:
 @click.command()
 @click.argument(
     'file_arg',
-    type=click.Path(exists=True, path_type=Path),
+    type=PATH_IN,
     required=False
 )
 @click.option(
     '-f', '--file',
-    type=click.Path(exists=True, path_type=Path),
+    type=PATH_IN,
     help='Path to the Markdown file to render.'
 )
 @click.option(
     '-o', '--output',
-    type=click.Path(path_type=Path),
+    type=PATH_OUT,
     help='Alternative option for input file path (for backward compatibility).'
 )
 @click.option(
     '-i', '--input',
-    type=click.Path(path_type=Path),
+    type=PATH_OUT,
     help='Alternative option for input file path.'
 )
-def markd(file_arg: Optional[Path], file: Optional[Path], output: Optional[Path], input: Optional[Path]) -> None:
+@click.option(
+    '-w', '--width',
+    type=int,
+    help='Output width in characters.'
+)
+def markd(file_arg: Optional[Path], file: Optional[Path], output: Optional[Path], input: Optional[Path], width: Optional[int]) -> None:
     """
     Render Markdown files beautifully in the terminal using Rich.
 
@@ -104,6 +111,7 @@ def markd(file_arg: Optional[Path], file: Optional[Path], output: Optional[Path]
         file: File path specified via -f/--file option.
         output: File path via -o/--output option (legacy compatibility).
         input: File path via -i/--input option (legacy compatibility).
+        width: Optional output width in characters for wrapping.
 
     Note:
         Priority order: file_arg > file > output > input.
@@ -115,16 +123,16 @@ def markd(file_arg: Optional[Path], file: Optional[Path], output: Optional[Path]
         markd --file documentation.md
         markd -o guide.md
         markd -i ./docs/guide.md
+        markd README.md -w 100
     """
-    console = Console()
+    console = Console(width=width)
 
     # Determine which file path to use (priority: argument > file > output > input)
     file_path = file_arg or file or output or input
 
     # If no file specified, prompt the user
     if file_path is None:
-        file_path_str = click.prompt('Enter the path to the Markdown file', type=str)
-        file_path = Path(file_path_str)
+        file_path = click.prompt('Enter the path to the Markdown file', type=PATH_OUT)
 
     try:
         # Read the Markdown file
@@ -5,16 +5,30 @@ PDF conversion tools.
 This module provides functionality to convert text and Markdown files to PDF format.
 """
 
+import mmap
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
 import click
-from rich.console import Console
+from super_pocket._click_types import PATH_IN, PATH_OUT
+from super_pocket._lazy import LazyConsole
 
 
-console = Console()
+console = LazyConsole()
+
+# Size of the blocks read from text files before being laid out by fpdf2
+TXT_BLOCK_SIZE = 64 * 1024
+
+# Text files above this size are decoded straight from a memory map
+TXT_MMAP_THRESHOLD = 1 << 20
+
+# Optional dependencies, imported on first use by the _load_*() helpers.
+# _MISSING records an import that already failed.
+_MISSING = object()
+_FPDF = None
+_MD_PDF = None
 
 
 def convert_to_pdf(input_file: Path, output_file: Path) -> None:
@@ -54,8 +68,9 @@ def convert_txt_to_pdf(input_file: Path, output_file: Path) -> None:
     """
     Convert a text file to PDF using fpdf2.
 
-    Creates a simple PDF with Arial font at 12pt size. Each line from the text
-    file is rendered as a multi-cell paragraph in the PDF.
+    Creates a simple PDF with Arial font at 12pt size. The text is laid out
+    by fpdf2 in blocks of about 64 KiB split on line boundaries, instead of
+    one multi-cell call per line.
 
     Args:
         input_file: Path to the input text file.
@@ -64,68 +79,207 @@ def convert_txt_to_pdf(input_file: Path, output_file: Path) -> None:
     Raises:
         ImportError: If fpdf2 library is not installed.
     """
-    try:
-        from fpdf import FPDF
-    except ImportError:
+    fpdf_class = _load_fpdf()
+
+    pdf = fpdf_class()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+
+    text = _read_text(input_file)
+    for block in _split_text_blocks(text):
+        pdf.multi_cell(0, 10, block)
+
+    pdf.output(str(output_file))
+
+
+def _load_fpdf():
+    """
+    Import fpdf2 on first use and cache its FPDF class.
+
+    A failed import is cached too, so later calls don't search for the
+    package again.
+
+    Returns:
+        type: The FPDF class.
+
+    Raises:
+        ImportError: If fpdf2 library is not installed.
+    """
+    global _FPDF
+    if _FPDF is None:
+        try:
+            from fpdf import FPDF
+            _FPDF = FPDF
+        except ImportError:
+            _FPDF = _MISSING
+
+    if _FPDF is _MISSING:
         console.print(
             "[red]Error:[/red] fpdf2 is not installed. "
             "Install it with: pip install fpdf2",
             style="bold"
         )
-        raise
+        raise ImportError("fpdf2 is not installed")
+    return _FPDF
 
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            pdf.multi_cell(0, 10, txt=line)
+def _read_text(input_file: Path) -> str:
+    """
+    Read and decode a UTF-8 text file in a single pass.
 
-    pdf.output(str(output_file))
+    Large files are memory-mapped and decoded straight from the mapping, so
+    the raw bytes are never copied into a Python bytes object. The UTF-8
+    decoder already takes a fast path over ASCII runs.
 
+    Args:
+        input_file: Path to the text file.
 
-def convert_md_to_pdf(input_file: Path, output_file: Path) -> None:
+    Returns:
+        str: The decoded file content.
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8.
     """
-    Convert a Markdown file to PDF using markdown-pdf.
+    if input_file.stat().st_size <= TXT_MMAP_THRESHOLD:
+        return input_file.read_bytes().decode('utf-8')
 
-    Preserves Markdown formatting including headers, lists, code blocks, and
-    other Markdown elements in the generated PDF document.
+    with input_file.open('rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return str(mm, 'utf-8')
+
+
+def _split_text_blocks(text: str, block_size: int = TXT_BLOCK_SIZE) -> Iterator[str]:
+    """
+    Split text into blocks that end on a line boundary.
+
+    The newline at the end of each block is dropped, since fpdf2 starts a new
+    line after every multi-cell anyway.
 
     Args:
-        input_file: Path to the input Markdown file.
-        output_file: Path to the output PDF file.
+        text: Text to split.
+        block_size: Minimum number of characters per block, except for the
+                    last one.
+
+    Yields:
+        str: Consecutive blocks of complete lines.
+    """
+    start = 0
+    while start < len(text):
+        cut = text.find('\n', start + block_size)
+        if cut < 0:
+            yield text[start:].removesuffix('\n')
+            break
+        yield text[start:cut]
+        start = cut + 1
+
+
+def _load_markdown_pdf():
+    """
+    Import markdown-pdf on first use and cache its classes.
+
+    A failed import is cached too, so later calls don't search for the
+    package again.
+
+    Returns:
+        tuple: The (Section, MarkdownPdf) classes.
 
     Raises:
         ImportError: If markdown-pdf library is not installed.
     """
-    try:
-        from markdown_pdf import Section, MarkdownPdf
-    except ImportError:
+    global _MD_PDF
+    if _MD_PDF is None:
+        try:
+            from markdown_pdf import Section, MarkdownPdf
+            _MD_PDF = (Section, MarkdownPdf)
+        except ImportError:
+            _MD_PDF = _MISSING
+
+    if _MD_PDF is _MISSING:
         console.print(
             "[red]Error:[/red] markdown-pdf is not installed. "
             "Install it with: pip install markdown-pdf",
             style="bold"
         )
-        raise
+        raise ImportError("markdown-pdf is not installed")
+    return _MD_PDF
+
+
+def _split_md_chapters(markdown_content: str) -> List[str]:
+    """
+    Split a Markdown document on its top-level (``# ``) headings.
+
+    Lines inside fenced code blocks are never treated as headings, and any
+    text before the first heading stays with the first chapter.
+
+    Args:
+        markdown_content: The Markdown document.
 
-    pdf = MarkdownPdf()
+    Returns:
+        List[str]: The chapters, in document order. A document without
+                   several top-level headings is returned as a single chapter.
+    """
+    chapters = []
+    current: List[str] = []
+    # Character and run length of the open fence, if any
+    fence: Optional[Tuple[str, int]] = None
+    seen_heading = False
+
+    for line in markdown_content.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if stripped.startswith(('```', '~~~')):
+            char = stripped[0]
+            run = len(stripped) - len(stripped.lstrip(char))
+            if fence is None:
+                fence = (char, run)
+            elif (char == fence[0] and run >= fence[1]
+                  and not stripped[run:].strip()):
+                # Only a bare run at least as long as the opening one closes
+                fence = None
+        elif fence is None and line.startswith('# '):
+            if seen_heading:
+                chapters.append(''.join(current))
+                current = []
+            seen_heading = True
+        current.append(line)
+
+    chapters.append(''.join(current))
+    return [chapter for chapter in chapters if chapter.strip()] or [markdown_content]
+
+
+def convert_md_to_pdf(input_file: Path, output_file: Path) -> None:
+    """
+    Convert a Markdown file to PDF using markdown-pdf.
+
+    Preserves Markdown formatting including headers, lists, code blocks, and
+    other Markdown elements in the generated PDF document. Each top-level
+    (``# ``) chapter is laid out as its own section, so markdown-pdf works on
+    smaller documents and every chapter starts on a new page.
+
+    Args:
+        input_file: Path to the input Markdown file.
+        output_file: Path to the output PDF file.
+
+    Raises:
+        ImportError: If markdown-pdf library is not installed.
+    """
+    section_class, markdown_pdf_class = _load_markdown_pdf()
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        markdown_content = f.read()
+    pdf = markdown_pdf_class()
+    markdown_content = input_file.read_text(encoding='utf-8')
 
-    pdf.add_section(Section(markdown_content))
+    for chapter in _split_md_chapters(markdown_content):
+        pdf.add_section(section_class(chapter))
     pdf.save(str(output_file))
 
 
 @click.command()
 @click.argument(
     'input_file',
-    type=click.Path(exists=True, path_type=Path)
+    type=PATH_IN
 )
 @click.option(
     '-o', '--output',
-    type=click.Path(path_type=Path),
+    type=PATH_OUT,
     help='Output PDF file path. Default: <input_file>.pdf'
 )
 def pdf_convert(input_file: Path, output: Optional[Path]) -> None:
@@ -6,12 +6,29 @@ This module scans a project directory and generates a single Markdown file
 containing the entire codebase with syntax highlighting and file tree structure.
 """
 
+import codecs
 import os
 import argparse
 import sys
-from collections.abc import Generator
+import warnings
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import filterfalse, islice
 from pathlib import Path
-from typing import Set
+from typing import AbstractSet, BinaryIO, Dict, FrozenSet, List, Optional, Tuple, Union
+
+# Open large file and the number of bytes to stream from it
+_LargeFile = Tuple[BinaryIO, int]
+
+# Raw file content handed to the Markdown writer
+_FileContent = Union[bytes, _LargeFile]
+
+# (files, subdirs) entries of a directory, as listed by _list_dir
+_DirListing = Tuple[List[os.DirEntry[str]], List[os.DirEntry[str]]]
+
+# (content, error) pair returned for each file read
+_ReadResult = Tuple[Optional[_FileContent], Optional[Exception]]
 
 # Language mapping for syntax highlighting in Markdown code blocks
 LANG_MAP = {
@@ -39,6 +56,76 @@ LANG_MAP = {
     'Dockerfile': 'dockerfile',
 }
 
+# Opening code fence of each LANG_MAP key, encoded once
+_FENCE_OPEN = {key: f"```{lang}\n".encode('utf-8') for key, lang in LANG_MAP.items()}
+_FENCE_DEFAULT = b"```plaintext\n"
+
+# Extensions of files that are never text, skipped without being opened
+BINARY_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip', '.gz', '.tar', '.whl',
+    '.so', '.dylib', '.dll', '.exe', '.pyc', '.bin', '.ico', '.woff', '.woff2',
+})
+
+# Size of the head of each file searched for NUL bytes
+_BINARY_PROBE_SIZE = 4096
+
+# Files above this size are streamed to the output instead of read into memory
+STREAM_THRESHOLD = 1 << 20
+
+# Size of the chunks copied (and validated) at a time when streaming a file
+_STREAM_CHUNK_SIZE = 1 << 20
+
+# Buffer size of the Markdown output file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Constant Markdown fragments, encoded once
+_TREE_CLOSE = b"```\n\n"
+_FENCE_CLOSE = b"\n```\n\n"
+
+# Prefixes of the ASCII tree lines
+BRANCH = '├── '
+LAST = '└── '
+
+# Indentation of each tree level, grown as deeper levels are reached
+_INDENTS = ['']
+
+# Most threads listing directories at once
+SCAN_MAX_WORKERS = 8
+
+
+class BinaryFileError(ValueError):
+    """Exception raised when a project file is detected as binary."""
+    pass
+
+
+def _lang_key(filename: str) -> str:
+    """
+    Return the LANG_MAP key matching a file name, or '' if there is none.
+
+    Args:
+        filename: The name of the file (can be basename or full path).
+
+    Returns:
+        str: The file name itself for special files like 'Dockerfile',
+             otherwise its lowercased extension.
+    """
+    # Strip any directory part (a no-op for the bare names the scan passes),
+    # after either separator where the platform has two
+    cut = filename.rfind(os.sep)
+    if os.altsep:
+        cut = max(cut, filename.rfind(os.altsep))
+    name = filename[cut + 1:]
+
+    # Handle special cases like 'Dockerfile' without extension
+    if name in LANG_MAP:
+        return name
+
+    # Handle standard extensions, a leading dot (hidden file) is not one
+    dot = name.rfind('.')
+    if dot <= 0:
+        return ''
+    return name[dot:].lower()
+
 
 def get_language_identifier(filename: str) -> str:
     """
@@ -61,16 +148,190 @@ def get_language_identifier(filename: str) -> str:
         >>> get_language_identifier('Dockerfile')
         'dockerfile'
     """
-    # Handle special cases like 'Dockerfile' without extension
-    if os.path.basename(filename) in LANG_MAP:
-        return LANG_MAP[os.path.basename(filename)]
+    return LANG_MAP.get(_lang_key(filename), 'plaintext')
+
+
+def get_fence_open(filename: str) -> bytes:
+    """
+    Return the encoded opening code fence for a file, language included.
+
+    Args:
+        filename: The name of the file (can be basename or full path).
 
-    # Handle standard extensions
-    _, ext = os.path.splitext(filename)
-    return LANG_MAP.get(ext.lower(), 'plaintext')
+    Returns:
+        bytes: The fence line, e.g. b"```python\\n". Falls back to a
+               'plaintext' fence if the extension is not recognized.
+
+    Example:
+        >>> get_fence_open('script.py')
+        b'```python\\n'
+    """
+    return _FENCE_OPEN.get(_lang_key(filename), _FENCE_DEFAULT)
+
+
+def parse_exclude(exclude_str: str) -> FrozenSet[str]:
+    """
+    Turn a comma-separated exclusion list into a frozen set of names.
+
+    Args:
+        exclude_str: Comma-separated string of files/directories to exclude
+                     (e.g., "node_modules,.git,__pycache__").
+
+    Returns:
+        frozenset: The names to exclude.
+
+    Example:
+        >>> sorted(parse_exclude('.git,node_modules'))
+        ['.git', 'node_modules']
+    """
+    return frozenset(exclude_str.split(','))
 
 
-def generate_tree(root_dir: str, exclude: Set[str]) -> Generator[str, None, None]:
+def _list_dir(
+    dir_path: str,
+    exclude: AbstractSet[str],
+    skip: Optional[os.stat_result] = None
+) -> _DirListing:
+    """
+    List a directory, split into its files and its subdirectories.
+
+    Uses os.scandir so that the file/directory type comes from the directory
+    listing itself instead of an extra stat() per entry. Both lists are
+    sorted by name. Symlinked directories are not followed and unreadable
+    directories are treated as empty, as os.walk does.
+
+    Args:
+        dir_path: Directory to list.
+        exclude: Set of file/directory names to skip.
+        skip: stat result of a file to leave out wherever it is found, such
+              as the output file being written.
+
+    Returns:
+        tuple: A pair (files, subdirs) of os.DirEntry lists.
+    """
+    files: List[os.DirEntry[str]] = []
+    subdirs: List[os.DirEntry[str]] = []
+    try:
+        with os.scandir(dir_path) as it:
+            entries_by_name = {entry.name: entry for entry in it}
+    except OSError:
+        return files, subdirs
+
+    for name in sorted(filterfalse(exclude.__contains__, entries_by_name)):
+        entry = entries_by_name[name]
+        if entry.is_dir():
+            if not entry.is_symlink():
+                subdirs.append(entry)
+        elif (skip is None or entry.inode() != skip.st_ino
+              or not os.path.samestat(entry.stat(), skip)):
+            files.append(entry)
+    return files, subdirs
+
+
+def _scan_dir(
+    dir_path: str,
+    list_dir: Callable[[str], _DirListing],
+    prefix_len: int,
+    level: int,
+    tree_lines: List[str],
+    file_entries: List[Tuple[str, str, str]]
+) -> None:
+    """
+    Recursively scan a directory, appending to the tree and file lists.
+
+    Files of a directory are listed before its subdirectories.
+
+    Args:
+        dir_path: Directory to scan.
+        list_dir: Function returning the (files, subdirs) listing of a
+                  directory, see _list_dir.
+        prefix_len: Length of the project root path plus its trailing
+                    separator, sliced off entry paths to make them relative.
+        level: Depth of dir_path below the project root.
+        tree_lines: List receiving the ASCII tree lines.
+        file_entries: List receiving (relative_path, filename, file_path) tuples.
+    """
+    files, subdirs = list_dir(dir_path)
+
+    # Indentation shared by every line of this directory
+    while len(_INDENTS) <= level:
+        _INDENTS.append(_INDENTS[-1] + '│   ')
+    indent = _INDENTS[level]
+    branch = indent + BRANCH
+
+    # Display files in current directory, using a different prefix for the
+    # last one
+    if files:
+        tree_lines.extend([branch + entry.name for entry in files[:-1]])
+        tree_lines.append(indent + LAST + files[-1].name)
+        file_entries.extend(
+            [(entry.path[prefix_len:], entry.name, entry.path) for entry in files]
+        )
+
+    # Then each subdirectory followed by its own content
+    for entry in subdirs:
+        tree_lines.append(branch + entry.name + '/')
+        _scan_dir(entry.path, list_dir, prefix_len, level + 1, tree_lines, file_entries)
+
+
+def _scan_project(
+    root_dir: str,
+    exclude: AbstractSet[str],
+    max_workers: int = 1,
+    skip: Optional[os.stat_result] = None
+) -> Tuple[List[str], List[Tuple[str, str, str]]]:
+    """
+    Walk a project once and collect both its tree and its files.
+
+    With more than one worker, directories are listed in a thread pool
+    (os.scandir releases the GIL): listing a directory immediately queues the
+    listing of its subdirectories, so the pool runs ahead of the tree
+    building, which still consumes the listings in order. The result is the
+    same as with a single worker.
+
+    Args:
+        root_dir: Root directory to scan.
+        exclude: Set of file/directory names to skip.
+        max_workers: Number of threads listing directories. 1 (default)
+                     lists them one after the other in the calling thread.
+        skip: stat result of a file to leave out, see _list_dir.
+
+    Returns:
+        tuple: A pair (tree_lines, file_entries), where tree_lines are the
+               lines of the ASCII tree and file_entries are
+               (relative_path, filename, file_path) tuples in output order.
+    """
+    tree_lines: List[str] = []
+    file_entries: List[Tuple[str, str, str]] = []
+    # Entry paths all start with root_dir joined to a separator
+    prefix_len = len(os.path.join(root_dir, ''))
+
+    if max_workers <= 1:
+        _scan_dir(
+            root_dir, lambda path: _list_dir(path, exclude, skip), prefix_len, 0,
+            tree_lines, file_entries
+        )
+        return tree_lines, file_entries
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        listings: Dict[str, Future[_DirListing]] = {}
+
+        def list_and_queue_subdirs(path: str) -> _DirListing:
+            listing = _list_dir(path, exclude, skip)
+            # Queued before returning, so they exist once this result is seen
+            for entry in listing[1]:
+                listings[entry.path] = executor.submit(list_and_queue_subdirs, entry.path)
+            return listing
+
+        listings[root_dir] = executor.submit(list_and_queue_subdirs, root_dir)
+        _scan_dir(
+            root_dir, lambda path: listings.pop(path).result(), prefix_len, 0,
+            tree_lines, file_entries
+        )
+    return tree_lines, file_entries
+
+
+def generate_tree(root_dir: str, exclude: AbstractSet[str]) -> Generator[str, None, None]:
     """
     Generate a text representation of the project tree structure.
 
@@ -92,30 +353,209 @@ def generate_tree(root_dir: str, exclude: Set[str]) -> Generator[str, None, None
         │   ├── main.py
         │   └── utils.py
     """
-    for root, dirs, files in os.walk(root_dir, topdown=True):
-        # Modify in-place to prevent os.walk from exploring excluded directories
-        dirs[:] = [d for d in dirs if d not in exclude]
-        files = [f for f in files if f not in exclude]
+    tree_lines, _ = _scan_project(root_dir, exclude)
+    yield from tree_lines
+
 
-        level = root.replace(root_dir, '').count(os.sep)
-        indent = '│   ' * (level - 1) + '├── ' if level > 0 else ''
+def _read_chunks(src: BinaryIO, size: int) -> Generator[bytes, None, None]:
+    """
+    Read at most size bytes of a binary stream, in _STREAM_CHUNK_SIZE chunks.
 
-        # Display current directory name (relative)
-        if level > 0:
-            yield f"{indent}{os.path.basename(root)}/"
+    Stopping at size rather than at EOF keeps a file that grows while it is
+    read (like the output file itself) from being copied forever.
 
-        # Display files in current directory
-        sub_indent = '│   ' * level + '├── '
-        for i, f in enumerate(sorted(files)):
-            # Use different prefix for last element
-            prefix = '└── ' if i == len(files) - 1 else '├── '
-            yield f"{'│   ' * level}{prefix}{f}"
+    Args:
+        src: Stream to read from.
+        size: Most bytes to read.
+
+    Yields:
+        bytes: The chunks read, none of them empty.
+    """
+    while size > 0 and (chunk := src.read(min(_STREAM_CHUNK_SIZE, size))):
+        size -= len(chunk)
+        yield chunk
+
+
+def _copy_utf8(src: BinaryIO, size: int, dst: Optional[BinaryIO]) -> None:
+    """
+    Copy a binary stream, checking on the way that it holds valid UTF-8.
+
+    The stream is copied chunk by chunk and fed to an incremental decoder, so
+    memory use stays bounded by _STREAM_CHUNK_SIZE whatever the file size.
+
+    Args:
+        src: Stream to read from.
+        size: Most bytes to copy, see _read_chunks.
+        dst: Stream to write to, or None to only check src.
+
+    Raises:
+        UnicodeDecodeError: If src is not valid UTF-8. Part of it may already
+                            have been written to dst.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in _read_chunks(src, size):
+        decoder.decode(chunk)
+        if dst is not None:
+            dst.write(chunk)
+    decoder.decode(b'', final=True)
+
+
+def _write_stream(md_file: BinaryIO, header: bytes, src: BinaryIO, size: int) -> bool:
+    """
+    Write a file header followed by a streamed file, then close the stream.
+
+    If the stream turns out not to be valid UTF-8, nothing of the file is
+    left behind: a seekable md_file is truncated back to where the header
+    started, while for other outputs (pipes, FIFOs, terminals) the file is
+    checked in a first pass before anything is written.
+
+    Args:
+        md_file: Markdown output file.
+        header: Encoded separator, file name and opening fence.
+        src: Open file returned by _read_file for a large file.
+        size: Size of the file when _read_file opened it, the most bytes
+              copied from src.
+
+    Returns:
+        bool: True if the file was written, False if it was skipped.
+    """
+    try:
+        if md_file.seekable():
+            start = md_file.tell()
+            try:
+                md_file.write(header)
+                _copy_utf8(src, size, md_file)
+            except UnicodeDecodeError:
+                md_file.seek(start)
+                md_file.truncate()
+                return False
+        else:
+            try:
+                _copy_utf8(src, size, None)
+            except UnicodeDecodeError:
+                return False
+            src.seek(0)
+            md_file.write(header)
+            for chunk in _read_chunks(src, size):
+                md_file.write(chunk)
+    finally:
+        src.close()
+    return True
+
+
+def _report(messages: List[str]) -> None:
+    """
+    Write messages to stderr, one per line, in a single write.
+
+    Args:
+        messages: Messages to report, possibly none.
+    """
+    if not messages:
+        return
+
+    text = "\n".join(messages) + "\n"
+    stream = getattr(sys.stderr, 'buffer', None)
+    if stream is None:
+        sys.stderr.write(text)
+        return
+
+    # Anything already written through the text layer goes out first
+    sys.stderr.flush()
+    stream.write(text.encode(sys.stderr.encoding or 'utf-8', 'backslashreplace'))
+    stream.flush()
+
+
+def _read_file(file_path: str) -> _ReadResult:
+    """
+    Read a UTF-8 text file as raw bytes without raising.
+
+    Files with a known binary extension are rejected without being opened,
+    and files with a NUL byte in their first _BINARY_PROBE_SIZE bytes without
+    being read further. Files up to STREAM_THRESHOLD are read into memory and
+    checked to be valid UTF-8. Larger files are returned as an open binary
+    stream along with their current size instead, for the caller to stream
+    out (and validate) with _write_stream, which also closes it.
+
+    Args:
+        file_path: Path of the file to read.
+
+    Returns:
+        tuple: A pair (content, error). content is a bytes object or an
+               (open binary file, size) pair, or
+               None when reading failed, in which case error holds the
+               exception (a BinaryFileError or UnicodeDecodeError for binary
+               files).
+    """
+    try:
+        if os.path.splitext(file_path)[1].lower() in BINARY_EXTS:
+            raise BinaryFileError(f"Binary file extension: {file_path}")
+
+        file_content = open(file_path, 'rb')
+        try:
+            probe = file_content.read(_BINARY_PROBE_SIZE)
+            if b'\x00' in probe:
+                raise BinaryFileError(f"NUL byte found in: {file_path}")
+
+            size = os.fstat(file_content.fileno()).st_size
+            if size > STREAM_THRESHOLD:
+                # Handed over open: the writer streams it, then closes it
+                file_content.seek(0)
+                return (file_content, size), None
+
+            content = probe + file_content.read()
+        except BaseException:
+            file_content.close()
+            raise
+        file_content.close()
+
+        content.decode('utf-8')
+        return content, None
+    except Exception as e:
+        return None, e
+
+
+def _read_files(
+    file_paths: Iterable[str],
+    max_workers: Optional[int] = None
+) -> Iterator[_ReadResult]:
+    """
+    Read files concurrently, yielding results in the order of file_paths.
+
+    Reads run in a thread pool (the GIL is released while waiting on the
+    disk), so the kernel always has several requests queued. Only a bounded
+    number of reads is in flight at once, so memory stays proportional to the
+    pool size rather than to the whole project.
+
+    Args:
+        file_paths: Paths of the files to read, in output order.
+        max_workers: Number of reader threads. Defaults to
+                     min(32, cpu_count * 4).
+
+    Yields:
+        tuple: The (content, error) pair returned by _read_file for each path.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    paths = iter(file_paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(_read_file, path)
+            for path in islice(paths, max_workers * 2)
+        )
+        while pending:
+            result = pending.popleft().result()
+            for path in islice(paths, 1):
+                pending.append(executor.submit(_read_file, path))
+            yield result
 
 
 def create_codebase_markdown(
     project_path: str,
-    output_file: str,
-    exclude_str: str
+    output_file: Optional[str],
+    exclude: Union[str, AbstractSet[str], None] = None,
+    *,
+    exclude_str: Optional[str] = None
 ) -> None:
     """
     Scan a project and generate a comprehensive Markdown documentation file.
@@ -134,10 +574,14 @@ def create_codebase_markdown(
         project_path: Path to the project root directory.
         output_file: Path to the output Markdown file. If None, defaults to
                     '<project_name>-1-file.md'.
-        exclude_str: Comma-separated string of files/directories to exclude
-                    (e.g., "node_modules,.git,__pycache__").
+        exclude: Files/directories to exclude, either as a set of names
+                 (see parse_exclude) or as a comma-separated string
+                 (e.g., "node_modules,.git,__pycache__").
+        exclude_str: Deprecated alias of exclude, kept for callers that pass
+                     the comma-separated string by keyword.
 
     Raises:
+        TypeError: If neither or both of exclude and exclude_str are given.
         IOError: If there's an error writing to the output file.
         SystemExit: If the project path doesn't exist or an error occurs during processing.
 
@@ -145,16 +589,29 @@ def create_codebase_markdown(
         >>> create_codebase_markdown(
         ...     project_path='/path/to/my-app',
         ...     output_file='my-app.md',
-        ...     exclude_str='node_modules,.git,dist'
+        ...     exclude=parse_exclude('node_modules,.git,dist')
         ... )
         🚀 Starting project scan: 'my-app'
         ...
         🎉 Success! Codebase compiled into 'my-app.md'
     """
+    if exclude_str is not None:
+        if exclude is not None:
+            raise TypeError("Pass either 'exclude' or 'exclude_str', not both.")
+        warnings.warn(
+            "'exclude_str' is deprecated, use 'exclude' instead.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        exclude = exclude_str
+    if exclude is None:
+        raise TypeError("create_codebase_markdown() missing required argument: 'exclude'")
+
     # Clean up paths and exclusions
     project_path = os.path.abspath(project_path)
     project_name = os.path.basename(project_path)
-    exclude_set = set(exclude_str.split(','))
+    if isinstance(exclude, str):
+        exclude = parse_exclude(exclude)
 
     # Set default output filename if not provided
     if output_file is None:
@@ -163,51 +620,53 @@ def create_codebase_markdown(
     print(f"🚀 Starting project scan: '{project_name}'")
     print(f"📂 Source directory: {project_path}")
     print(f"📋 Output file: {output_file}")
-    print(f"🙈 Excluded items: {exclude_set}")
+    print(f"🙈 Excluded items: {', '.join(sorted(exclude))}")
 
     try:
-        with open(output_file, 'w', encoding='utf-8') as md_file:
+        with open(output_file, 'wb', buffering=OUTPUT_BUFFER_SIZE) as md_file:
             # 1. Write main title
-            md_file.write(f"# {project_name}\n\n")
+            md_file.write(f"# {project_name}\n\n".encode('utf-8'))
 
-            # 2. Generate and write project tree
+            # 2. Walk the project once, then write its tree
             print("🌳 Generating file tree...")
-            md_file.write("```bash\n")
-            md_file.write(f"{project_name}/\n")
-            for line in generate_tree(project_path, exclude_set):
-                md_file.write(f"{line}\n")
-            md_file.write("```\n\n")
+            scan_workers = min(SCAN_MAX_WORKERS, os.cpu_count() or 1)
+            # The output file is left out in case it lies inside the project
+            tree_lines, file_entries = _scan_project(
+                project_path, exclude, scan_workers, os.fstat(md_file.fileno())
+            )
+            md_file.write(f"```bash\n{project_name}/\n".encode('utf-8'))
+            md_file.write(''.join(f"{line}\n" for line in tree_lines).encode('utf-8'))
+            md_file.write(_TREE_CLOSE)
             print("✅ File tree generated.")
 
-            # 3. Walk through files and write their content
+            # 3. Write the content of the files found during the walk
             print("📝 Reading and writing file contents...")
-            for root, dirs, files in os.walk(project_path, topdown=True):
-                # Ensure we don't descend into excluded directories
-                dirs[:] = [d for d in dirs if d not in exclude_set]
-
-                for filename in sorted(files):
-                    if filename in exclude_set:
-                        continue
-
-                    file_path = os.path.join(root, filename)
-                    relative_path = os.path.relpath(file_path, project_path)
-
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as file_content:
-                            content = file_content.read()
-                            lang = get_language_identifier(filename)
-
-                            md_file.write("---\n\n")  # Horizontal separator
-                            md_file.write(f"**`{relative_path}`**:\n")
-                            md_file.write(f"```{lang}\n")
-                            md_file.write(content)
-                            md_file.write("\n```\n\n")
-
-                    except UnicodeDecodeError:
-                        print(f"⚠️  Warning: Cannot read file '{relative_path}' (probably binary). Skipping.")
-                    except Exception as e:
-                        print(f"❌ Error reading file '{relative_path}': {e}")
-
+            file_paths = (file_path for _, _, file_path in file_entries)
+            contents = _read_files(file_paths)
+            # Skipped files are reported together once all files are written
+            problems: List[str] = []
+            for (relative_path, filename, _), (content, error) in zip(file_entries, contents):
+                if content is None:
+                    if isinstance(error, (BinaryFileError, UnicodeDecodeError)):
+                        problems.append(f"⚠️  Warning: Cannot read file '{relative_path}' (probably binary). Skipping.")
+                    else:
+                        problems.append(f"❌ Error reading file '{relative_path}': {error}")
+                    continue
+
+                # Horizontal separator, file name and opening fence
+                header = (
+                    f"---\n\n**`{relative_path}`**:\n".encode('utf-8')
+                    + get_fence_open(filename)
+                )
+                if isinstance(content, bytes):
+                    md_file.write(header)
+                    md_file.write(content)
+                elif not _write_stream(md_file, header, *content):
+                    problems.append(f"⚠️  Warning: Cannot read file '{relative_path}' (probably binary). Skipping.")
+                    continue
+                md_file.write(_FENCE_CLOSE)
+
+            _report(problems)
             print("✅ File contents written.")
 
     except IOError as e:
@@ -220,7 +679,7 @@ def create_codebase_markdown(
     print(f"\n🎉 Success! Codebase compiled into '{output_file}'")
 
 
-def main():
+def main() -> None:
     """
     Entry point for CLI argument handling.
 
@@ -266,7 +725,7 @@ def main():
         print(f"Error: Project path '{args.projet}' does not exist or is not a directory.", file=sys.stderr)
         sys.exit(1)
 
-    create_codebase_markdown(args.projet, args.output, args.exclude)
+    create_codebase_markdown(args.projet, args.output, parse_exclude(args.exclude))
 
 
 if __name__ == '__main__':
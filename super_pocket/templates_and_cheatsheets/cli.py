@@ -18,6 +18,7 @@ from rich.console import Console
 from rich.markdown import Markdown
 from rich.table import Table
 
+from super_pocket._click_types import PATH_OUT
 from . import TEMPLATES_DIR, CHEATSHEETS_DIR
 
 
@@ -169,7 +170,7 @@ def view_item(name: str, type: Optional[str]):
 @click.argument('name', type=str)
 @click.option(
     '--output', '-o',
-    type=click.Path(path_type=Path),
+    type=PATH_OUT,
     help='Output path for the copied file. If directory, file will be copied there with original name.'
 )
 @click.option(
@@ -254,7 +255,7 @@ def copy_item(name: str, output: Optional[Path], type: Optional[str], force: boo
 @templates_cli.command(name="init")
 @click.option(
     '--output', '-o',
-    type=click.Path(path_type=Path),
+    type=PATH_OUT,
     default=Path.cwd() / ".AGENTS",
     help='Directory where agent templates will be initialized.'
 )
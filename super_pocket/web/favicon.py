@@ -6,30 +6,99 @@ This module provides functionality to convert images to favicon (.ico) format
 with multiple sizes for web compatibility.
 """
 
+import math
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional, Sequence, Tuple
 
 import click
-from rich.console import Console
+from super_pocket._click_types import PATH_IN, PATH_OUT
+from super_pocket._lazy import LazyConsole
 
 
-console = Console()
+console = LazyConsole()
 
 # Standard favicon sizes
-DEFAULT_FAVICON_SIZES: List[Tuple[int, int]] = [
+DEFAULT_FAVICON_SIZES: Tuple[Tuple[int, int], ...] = (
     (256, 256),
     (128, 128),
     (64, 64),
     (48, 48),
     (32, 32),
     (16, 16)
-]
+)
+
+# PIL.Image module, imported on first use by _load_pil_image().
+# _MISSING records an import that already failed.
+_MISSING = object()
+_PIL_IMAGE = None
+
+
+def _load_pil_image():
+    """
+    Import Pillow on first use and cache its Image module.
+
+    A failed import is cached too, so later calls don't search for the
+    package again.
+
+    Returns:
+        module: The PIL.Image module.
+
+    Raises:
+        ImportError: If PIL/Pillow is not installed.
+    """
+    global _PIL_IMAGE
+    if _PIL_IMAGE is None:
+        try:
+            from PIL import Image
+            _PIL_IMAGE = Image
+        except ImportError:
+            _PIL_IMAGE = _MISSING
+
+    if _PIL_IMAGE is _MISSING:
+        console.print(
+            "[red]Error:[/red] Pillow is not installed. "
+            "Install it with: pip install Pillow",
+            style="bold"
+        )
+        raise ImportError("Pillow is not installed")
+    return _PIL_IMAGE
+
+
+def _fit_size(image_size: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Compute the size of an image shrunk to fit a box, keeping its aspect ratio.
+
+    Rounds the same way as Pillow's Image.thumbnail(), which the ICO encoder
+    uses for each requested size.
+
+    Args:
+        image_size: (width, height) of the source image.
+        box: (width, height) the image must fit in.
+
+    Returns:
+        tuple: The (width, height) of the shrunk image. The image size itself
+               if it already fits in the box.
+    """
+    width, height = image_size
+    x, y = box
+    if x >= width and y >= height:
+        return width, height
+
+    def round_aspect(number, key):
+        return max(min(math.floor(number), math.ceil(number), key=key), 1)
+
+    aspect = width / height
+    if x / y >= aspect:
+        x = round_aspect(y * aspect, key=lambda n: abs(aspect - n / y))
+    else:
+        y = round_aspect(x / aspect, key=lambda n: 0 if n == 0 else abs(aspect - x / n))
+    return x, y
 
 
 def convert_to_favicon(
     input_file: Path,
     output_file: Path,
-    sizes: Optional[List[Tuple[int, int]]] = None
+    sizes: Optional[Sequence[Tuple[int, int]]] = None
 ) -> None:
     """
     Convert an image to a favicon (.ico) file with multiple sizes.
@@ -37,7 +106,7 @@ def convert_to_favicon(
     Args:
         input_file: Path to the input image file.
         output_file: Path to the output .ico file.
-        sizes: List of (width, height) tuples for icon sizes.
+        sizes: Sequence of (width, height) tuples for icon sizes.
                Defaults to standard favicon sizes.
 
     Raises:
@@ -45,15 +114,7 @@ def convert_to_favicon(
         ImportError: If PIL/Pillow is not installed.
         ValueError: If output file doesn't have .ico extension.
     """
-    try:
-        from PIL import Image
-    except ImportError:
-        console.print(
-            "[red]Error:[/red] Pillow is not installed. "
-            "Install it with: pip install Pillow",
-            style="bold"
-        )
-        raise
+    pil_image = _load_pil_image()
 
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
@@ -64,9 +125,44 @@ def convert_to_favicon(
     if sizes is None:
         sizes = DEFAULT_FAVICON_SIZES
 
-    # Open and convert image
-    img = Image.open(input_file)
-    img.save(str(output_file), format="ICO", sizes=sizes)
+    img = pil_image.open(input_file)
+
+    # Keep the sizes the ICO format can hold without upscaling the source,
+    # and shrink the source into each of them keeping its aspect ratio, as
+    # Pillow's ICO encoder would. Largest first.
+    max_width, max_height = min(img.width, 256), min(img.height, 256)
+    pyramid_sizes = sorted(
+        {_fit_size(img.size, size) for size in sizes
+         if size[0] <= max_width and size[1] <= max_height},
+        reverse=True
+    )
+
+    # Let the decoder skip detail the largest icon doesn't need
+    if pyramid_sizes:
+        img.draft(None, pyramid_sizes[0])
+    img.load()
+
+    # Convert once up front so every resize and the ICO encoder see RGBA,
+    # instead of a mode conversion per icon size
+    if img.mode != 'RGBA':
+        img = img.convert('RGBA')
+
+    if pyramid_sizes:
+        # Resample each size from the previous one instead of the original.
+        # The first step box-reduces large sources to within 3x of the target
+        # before applying LANCZOS on the smaller intermediate image.
+        pyramid = [img.resize(pyramid_sizes[0], pil_image.LANCZOS, reducing_gap=3.0)]
+        for size in pyramid_sizes[1:]:
+            pyramid.append(pyramid[-1].resize(size, pil_image.LANCZOS))
+
+        pyramid[0].save(
+            str(output_file),
+            format="ICO",
+            sizes=pyramid_sizes,
+            append_images=pyramid[1:]
+        )
+    else:
+        img.save(str(output_file), format="ICO", sizes=sizes)
 
     console.print(
         f"[green]✓[/green] Favicon saved to '{output_file}' with {len(sizes)} sizes",
@@ -77,11 +173,11 @@ def convert_to_favicon(
 @click.command()
 @click.argument(
     'input_file',
-    type=click.Path(exists=True, path_type=Path)
+    type=PATH_IN
 )
 @click.option(
     '-o', '--output',
-    type=click.Path(path_type=Path),
+    type=PATH_OUT,
     help='Output favicon file path. Default: favicon.ico'
 )
 @click.option(
@@ -117,9 +213,11 @@ def favicon_convert(
         flavicon logo.png -o favicon.ico
     """
     # Determine output path
+    # A relative path is resolved against the working directory when the
+    # file is opened, without a getcwd() call here
     if output is None:
-        output = Path.cwd() / "favicon.ico"
-    elif not str(output).endswith('.ico'):
+        output = Path("favicon.ico")
+    elif output.suffix != '.ico':
         # Auto-add .ico extension if not present
         output = output.with_suffix('.ico')
 
@@ -127,10 +225,10 @@ def favicon_convert(
     size_list = None
     if sizes:
         try:
-            size_list = []
-            for size_str in sizes.split(','):
-                w, h = map(int, size_str.strip().split('x'))
-                size_list.append((w, h))
+            size_list = tuple(
+                (int(w), int(h))
+                for w, h in (size_str.strip().split('x') for size_str in sizes.split(','))
+            )
         except (ValueError, AttributeError) as e:
             console.print(
                 f"[red]Error:[/red] Invalid size format. Use 'WxH,WxH' (e.g., '64x64,32x32')",
@@ -38,6 +38,16 @@ def test_cli_markdown_render(runner: CliRunner, sample_markdown_file):
     assert result.exit_code in [0, 1]
 
 
+def test_cli_markdown_render_width(runner: CliRunner, sample_markdown_file):
+    """Test markdown render with a custom output width."""
+    result = runner.invoke(
+        cli,
+        ['markdown', 'render', str(sample_markdown_file), '-w', '40']
+    )
+    assert result.exit_code == 0
+    assert "Test Document" in result.output
+
+
 def test_cli_markdown_render_nonexistent(runner: CliRunner):
     """Test markdown render with non-existent file."""
     result = runner.invoke(
@@ -268,4 +278,20 @@ def test_cli_web_group_help(runner: CliRunner):
     """Test web group help."""
     result = runner.invoke(cli, ['web', '--help'])
     assert result.exit_code == 0
+    assert "favicon" in result.output
+    assert "job-search" in result.output
+
+
+def test_cli_lazy_group_registers_real_command():
+    """Test that lazy subcommands resolve to the module's click command."""
+    import click
+
+    from super_pocket.pdf.converter import pdf_convert
+
+    pdf_group = cli.commands['pdf']
+    ctx = click.Context(pdf_group)
+
+    assert pdf_group.get_command(ctx, 'convert') is pdf_convert
+    assert pdf_group.commands['convert'] is pdf_convert
+    assert pdf_group.get_command(ctx, 'unknown') is None
 
@@ -0,0 +1,27 @@
+"""
+Tests for the lazy helpers module.
+"""
+
+from rich.console import Console
+
+from super_pocket._lazy import LazyConsole
+
+
+def test_lazy_console_not_built_until_used():
+    """Test that the console is only created on first attribute access."""
+    console = LazyConsole()
+    assert console._console is None
+
+    console.print("Hello")
+
+    assert isinstance(console._console, Console)
+
+
+def test_lazy_console_reuses_console():
+    """Test that the same console instance is kept across calls."""
+    console = LazyConsole()
+    first = console.file
+    built = console._console
+
+    assert console.file is first
+    assert console._console is built
@@ -103,3 +103,15 @@ def hello():
 """
     # Should not raise any exception
     render_markdown(complex_markdown, console)
+
+
+def test_markd_prompts_for_file(sample_markdown_file):
+    """Test that markd asks for a path when none is given."""
+    from click.testing import CliRunner
+
+    from super_pocket.markdown.renderer import markd
+
+    result = CliRunner().invoke(markd, [], input=f"{sample_markdown_file}\n")
+
+    assert result.exit_code == 0
+    assert "Test Document" in result.output
@@ -39,5 +39,123 @@ def test_pdf_converter_unsupported_extension(temp_dir):
         convert_to_pdf(input_file, output_file)
 
 
+def test_split_text_blocks_splits_on_line_boundaries():
+    """Test that text blocks only break between complete lines."""
+    from super_pocket.pdf.converter import _split_text_blocks
+
+    text = "first line\nsecond line\n\nfourth\n"
+    blocks = list(_split_text_blocks(text, block_size=8))
+
+    assert "\n".join(blocks) == "first line\nsecond line\n\nfourth"
+    assert len(blocks) > 1
+
+
+def test_read_text_large_file_uses_mmap(temp_dir, monkeypatch):
+    """Test that files above the mmap threshold decode the same way."""
+    from super_pocket.pdf import converter
+
+    monkeypatch.setattr(converter, "TXT_MMAP_THRESHOLD", 16)
+    content = "caf\u00e9 au lait\n" * 10
+    small_file = temp_dir / "small.txt"
+    small_file.write_text("small\n", encoding='utf-8')
+    large_file = temp_dir / "large.txt"
+    large_file.write_text(content, encoding='utf-8')
+
+    assert converter._read_text(small_file) == "small\n"
+    assert converter._read_text(large_file) == content
+
+
+def test_convert_txt_to_pdf_multiline(temp_dir):
+    """Test converting a multi-line text file to PDF."""
+    pytest.importorskip("fpdf")
+
+    input_file = temp_dir / "test.txt"
+    input_file.write_text("line one\nline two\n\nline four\n", encoding='utf-8')
+    output_file = temp_dir / "output.pdf"
+
+    convert_txt_to_pdf(input_file, output_file)
+
+    assert output_file.read_bytes().startswith(b"%PDF")
+
+
+def test_convert_md_to_pdf(sample_markdown_file, temp_dir):
+    """Test converting a Markdown file to PDF."""
+    pytest.importorskip("markdown_pdf")
+
+    output_file = temp_dir / "output.pdf"
+
+    convert_md_to_pdf(sample_markdown_file, output_file)
+
+    assert output_file.read_bytes().startswith(b"%PDF")
+
+
+def test_convert_txt_to_pdf_missing_fpdf(temp_dir, monkeypatch):
+    """Test that a missing fpdf2 raises ImportError and is only probed once."""
+    import sys
+
+    from super_pocket.pdf import converter
+
+    monkeypatch.setattr(converter, "_FPDF", None)
+    monkeypatch.setitem(sys.modules, "fpdf", None)
+
+    input_file = temp_dir / "test.txt"
+    input_file.write_text("test content", encoding='utf-8')
+    output_file = temp_dir / "output.pdf"
+
+    with pytest.raises(ImportError):
+        convert_txt_to_pdf(input_file, output_file)
+    assert converter._FPDF is converter._MISSING
+
+    with pytest.raises(ImportError):
+        convert_txt_to_pdf(input_file, output_file)
+
+
+def test_convert_txt_to_pdf_invalid_utf8(temp_dir):
+    """Test that non UTF-8 text files are rejected."""
+    pytest.importorskip("fpdf")
+
+    input_file = temp_dir / "test.txt"
+    input_file.write_bytes(b"caf\xe9\n")
+
+    with pytest.raises(UnicodeDecodeError):
+        convert_txt_to_pdf(input_file, temp_dir / "output.pdf")
+
+
+def test_split_md_chapters():
+    """Test splitting Markdown on top-level headings only."""
+    from super_pocket.pdf.converter import _split_md_chapters
+
+    content = (
+        "Intro text\n"
+        "# Chapter 1\n"
+        "## Section\n"
+        "```bash\n"
+        "# not a heading\n"
+        "```\n"
+        "# Chapter 2\n"
+        "Body\n"
+    )
+
+    chapters = _split_md_chapters(content)
+
+    assert len(chapters) == 2
+    assert chapters[0].startswith("Intro text\n# Chapter 1")
+    assert "# not a heading" in chapters[0]
+    assert chapters[1] == "# Chapter 2\nBody\n"
+    assert "".join(chapters) == content
+
+    # A longer fence is not closed by the shorter fences nested in it
+    nested = "# Guide\n\n````markdown\n```python\n# install deps\n```\n````\n"
+    assert _split_md_chapters(nested) == [nested]
+
+
+def test_split_md_chapters_flat_document():
+    """Test that a document with a single chapter is kept whole."""
+    from super_pocket.pdf.converter import _split_md_chapters
+
+    assert _split_md_chapters("# Title\n\nText\n") == ["# Title\n\nText\n"]
+    assert _split_md_chapters("") == [""]
+
+
 # Note: Full conversion tests require optional dependencies (fpdf2, markdown-pdf)
 # These are skipped if dependencies are not installed
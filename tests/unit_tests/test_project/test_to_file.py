@@ -2,6 +2,9 @@
 Tests for project to_file module.
 """
 
+import os
+import threading
+
 import pytest
 from pathlib import Path
 from super_pocket.project.to_file import (
@@ -134,3 +137,305 @@ def test_create_codebase_markdown_with_binary_file(sample_project_structure, tem
     content = output_file.read_text(encoding='utf-8')
     # Should still contain other files
     assert "main.py" in content or "test_project" in content
+
+
+def test_generate_tree_layout(sample_project_structure):
+    """Test that files come before subdirectories, both sorted by name."""
+    (sample_project_structure / "src" / "nested").mkdir()
+    (sample_project_structure / "src" / "nested" / "deep.py").write_text("", encoding='utf-8')
+
+    tree_lines = list(generate_tree(str(sample_project_structure), set()))
+
+    assert tree_lines == [
+        "└── README.md",
+        "├── src/",
+        "│   ├── main.py",
+        "│   └── utils.py",
+        "│   ├── nested/",
+        "│   │   └── deep.py",
+        "├── tests/",
+        "│   └── test_main.py",
+    ]
+
+
+def test_generate_tree_does_not_follow_directory_symlinks(sample_project_structure):
+    """Test that symlinked directories are not walked into."""
+    link = sample_project_structure / "linked_src"
+    try:
+        link.symlink_to(sample_project_structure / "src", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks are not supported on this platform")
+
+    tree_output = '\n'.join(generate_tree(str(sample_project_structure), set()))
+
+    assert "linked_src" not in tree_output
+
+
+def test_read_files_keeps_order(temp_dir):
+    """Test that concurrent reads are yielded in the requested order."""
+    from super_pocket.project.to_file import _read_files
+
+    paths = []
+    for i in range(20):
+        path = temp_dir / f"file_{i}.txt"
+        path.write_text(f"content {i}", encoding='utf-8')
+        paths.append(str(path))
+    (temp_dir / "binary.dat").write_bytes(b'\xff\xfe')
+    paths.insert(5, str(temp_dir / "binary.dat"))
+
+    results = list(_read_files(paths, max_workers=2))
+
+    assert len(results) == 21
+    assert isinstance(results[5][1], UnicodeDecodeError)
+    assert [content for content, _ in results[6:]] == [
+        f"content {i}".encode('utf-8') for i in range(5, 20)
+    ]
+
+
+def test_create_codebase_markdown_large_files(sample_project_structure, temp_dir, monkeypatch):
+    """Test that streamed files are written and validated like small ones."""
+    from super_pocket.project import to_file
+
+    monkeypatch.setattr(to_file, "STREAM_THRESHOLD", 8)
+    monkeypatch.setattr(to_file, "_STREAM_CHUNK_SIZE", 4)
+    # A multi-byte character spanning two chunks
+    (sample_project_structure / "notes.txt").write_text("abc\u00e9\u00e8 ok\n", encoding='utf-8')
+    # Invalid UTF-8 found after part of the file was already streamed
+    (sample_project_structure / "data.dat").write_bytes(b"0123456789\xff\xfe")
+    output_file = temp_dir / "output.md"
+
+    create_codebase_markdown(str(sample_project_structure), str(output_file), "")
+
+    content = output_file.read_text(encoding='utf-8')
+    assert "abc\u00e9\u00e8 ok\n" in content
+    assert "def helper(): pass" in content
+    assert "**`data.dat`**" not in content
+    assert "01234567" not in content
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_create_codebase_markdown_large_files_to_pipe(sample_project_structure, temp_dir, monkeypatch):
+    """Test that streamed files can be written to an output that can't seek."""
+    from super_pocket.project import to_file
+
+    monkeypatch.setattr(to_file, "STREAM_THRESHOLD", 8)
+    monkeypatch.setattr(to_file, "_STREAM_CHUNK_SIZE", 4)
+    (sample_project_structure / "notes.txt").write_text("abcéè ok\n", encoding='utf-8')
+    (sample_project_structure / "data.dat").write_bytes(b"0123456789\xff\xfe")
+    reference = temp_dir / "reference.md"
+    fifo = temp_dir / "output.md"
+    os.mkfifo(fifo)
+
+    received = []
+    reader = threading.Thread(target=lambda: received.append(fifo.read_bytes()))
+    reader.start()
+    create_codebase_markdown(str(sample_project_structure), str(fifo), "")
+    reader.join()
+    create_codebase_markdown(str(sample_project_structure), str(reference), "")
+
+    content = received[0].decode('utf-8')
+    assert "abcéè ok\n" in content
+    assert "**`data.dat`**" not in content
+    assert "01234567" not in content
+    assert content == reference.read_text(encoding='utf-8')
+
+
+def test_create_codebase_markdown_output_inside_project(sample_project_structure, monkeypatch):
+    """Test that an output file inside the project is neither listed nor streamed."""
+    from super_pocket.project import to_file
+
+    monkeypatch.setattr(to_file, "STREAM_THRESHOLD", 8)
+    monkeypatch.setattr(to_file, "_STREAM_CHUNK_SIZE", 4)
+    (sample_project_structure / "big.txt").write_text("large file body\n", encoding='utf-8')
+    (sample_project_structure / "zz").mkdir()
+    output_file = sample_project_structure / "zz" / "out.md"
+    # Leftover from a previous export, larger than STREAM_THRESHOLD
+    output_file.write_text("stale export\n" * 4, encoding='utf-8')
+
+    create_codebase_markdown(str(sample_project_structure), str(output_file), "")
+
+    content = output_file.read_text(encoding='utf-8')
+    assert content.count("large file body") == 1
+    assert "out.md" not in content
+    assert "stale export" not in content
+
+
+def test_read_chunks_stops_at_size(temp_dir):
+    """Test that a stream growing while it is copied is cut at the given size."""
+    from super_pocket.project.to_file import _read_chunks
+
+    path = temp_dir / "growing.txt"
+    path.write_bytes(b"0123456789")
+    with open(path, 'rb') as src, open(path, 'ab') as dst:
+        for chunk in _read_chunks(src, 10):
+            dst.write(chunk)
+            dst.flush()
+
+    assert path.read_bytes() == b"0123456789" * 2
+
+
+def test_create_codebase_markdown_frozen_exclude(sample_project_structure, temp_dir):
+    """Test that a parsed exclusion set matches the comma-separated string."""
+    from super_pocket.project.to_file import parse_exclude
+
+    from_string = temp_dir / "string.md"
+    from_set = temp_dir / "set.md"
+
+    create_codebase_markdown(str(sample_project_structure), str(from_string), "tests,README.md")
+    create_codebase_markdown(
+        str(sample_project_structure), str(from_set), parse_exclude("tests,README.md")
+    )
+
+    assert parse_exclude("tests,README.md") == frozenset({"tests", "README.md"})
+    content = from_set.read_text(encoding='utf-8')
+    assert content == from_string.read_text(encoding='utf-8')
+    assert "test_main.py" not in content
+    assert "README.md" not in content
+
+
+def test_create_codebase_markdown_exclude_str_alias(sample_project_structure, temp_dir):
+    """Test that the deprecated exclude_str keyword still works."""
+    reference = temp_dir / "reference.md"
+    output_file = temp_dir / "alias.md"
+
+    create_codebase_markdown(str(sample_project_structure), str(reference), exclude="tests")
+    with pytest.warns(DeprecationWarning, match="exclude_str"):
+        create_codebase_markdown(
+            project_path=str(sample_project_structure),
+            output_file=str(output_file),
+            exclude_str="tests"
+        )
+
+    assert output_file.read_text(encoding='utf-8') == reference.read_text(encoding='utf-8')
+
+    with pytest.raises(TypeError):
+        create_codebase_markdown(
+            str(sample_project_structure), str(output_file), "tests", exclude_str="tests"
+        )
+
+
+def test_generate_tree_deep_nesting(temp_dir):
+    """Test that each nesting level adds one indentation step."""
+    (temp_dir / "a" / "b" / "c").mkdir(parents=True)
+    (temp_dir / "a" / "b" / "c" / "leaf.txt").write_text("leaf", encoding='utf-8')
+
+    assert list(generate_tree(str(temp_dir), set())) == [
+        "├── a/",
+        "│   ├── b/",
+        "│   │   ├── c/",
+        "│   │   │   └── leaf.txt",
+    ]
+
+
+def test_generate_tree_child_named_like_root(temp_dir):
+    """Test that a child repeating the project name keeps its own depth."""
+    project = temp_dir / "app"
+    (project / "app" / "app").mkdir(parents=True)
+    (project / "app" / "app" / "app.py").write_text("", encoding='utf-8')
+
+    assert list(generate_tree(str(project), set())) == [
+        "├── app/",
+        "│   ├── app/",
+        "│   │   └── app.py",
+    ]
+
+
+def test_read_file_detects_binary_without_decoding(temp_dir):
+    """Test that binary files are caught by extension or by a NUL byte probe."""
+    from super_pocket.project.to_file import BinaryFileError, _read_file
+
+    image = temp_dir / "logo.PNG"
+    image.write_text("valid utf-8 but still an image", encoding='utf-8')
+    nul = temp_dir / "data.txt"
+    nul.write_bytes(b"valid utf-8\x00with a NUL")
+    text = temp_dir / "notes.txt"
+    text.write_text("x" * 5000, encoding='utf-8')
+
+    assert isinstance(_read_file(str(image))[1], BinaryFileError)
+    assert isinstance(_read_file(str(nul))[1], BinaryFileError)
+    assert _read_file(str(text)) == (b"x" * 5000, None)
+
+
+def test_get_language_identifier_paths_and_dotfiles():
+    """Test language identifier for full paths, dotfiles and extensionless names."""
+    assert get_language_identifier(os.path.join("src", "app", "main.py")) == "python"
+    assert get_language_identifier(os.path.join("docker", "Dockerfile")) == "dockerfile"
+    assert get_language_identifier(".bashrc") == "plaintext"
+    assert get_language_identifier("Makefile") == "plaintext"
+    assert get_language_identifier("archive.tar.SQL") == "sql"
+
+
+def test_get_language_identifier_alternate_separator(monkeypatch):
+    """Test that paths using the alternate separator (Windows '/') are stripped too."""
+    with monkeypatch.context() as m:
+        m.setattr(os, "sep", "\\")
+        m.setattr(os, "altsep", "/")
+        docker = get_language_identifier("docker/Dockerfile")
+        mixed = get_language_identifier("src\\app/main.py")
+
+    assert docker == "dockerfile"
+    assert mixed == "python"
+
+
+def test_scan_project_relative_paths(sample_project_structure, monkeypatch):
+    """Test that file paths are made relative to the project root."""
+    from super_pocket.project.to_file import _scan_project
+
+    expected = [
+        "README.md",
+        os.path.join("src", "main.py"),
+        os.path.join("src", "utils.py"),
+        os.path.join("tests", "test_main.py"),
+    ]
+
+    _, file_entries = _scan_project(str(sample_project_structure), set())
+    assert [relative_path for relative_path, _, _ in file_entries] == expected
+
+    monkeypatch.chdir(sample_project_structure)
+    _, file_entries = _scan_project(".", set())
+    assert [relative_path for relative_path, _, _ in file_entries] == expected
+
+
+def test_get_fence_open_matches_language_identifier():
+    """Test that encoded fences agree with the language identifiers."""
+    from super_pocket.project.to_file import get_fence_open
+
+    for name in ("app.py", "STYLE.CSS", "Dockerfile", ".bashrc", "unknown.xyz"):
+        expected = f"```{get_language_identifier(name)}\n".encode('utf-8')
+        assert get_fence_open(name) == expected
+
+
+def test_scan_project_parallel_matches_serial(temp_dir):
+    """Test that listing directories in a thread pool keeps the tree order."""
+    from super_pocket.project.to_file import _scan_project
+
+    for i in range(6):
+        for j in range(4):
+            subdir = temp_dir / f"pkg_{i}" / f"sub_{j}"
+            subdir.mkdir(parents=True)
+            (subdir / "module.py").write_text("", encoding='utf-8')
+        (temp_dir / f"pkg_{i}" / "__init__.py").write_text("", encoding='utf-8')
+    (temp_dir / "pkg_3" / "skip_me").mkdir()
+    (temp_dir / "pkg_3" / "skip_me" / "hidden.py").write_text("", encoding='utf-8')
+
+    serial = _scan_project(str(temp_dir), {"skip_me"})
+    parallel = _scan_project(str(temp_dir), {"skip_me"}, max_workers=4)
+
+    assert parallel == serial
+    assert len(serial[1]) == 6 * 5
+    assert "skip_me/" not in "\n".join(parallel[0])
+
+
+def test_create_codebase_markdown_reports_skipped_files(sample_project_structure, temp_dir, capsys):
+    """Test that skipped files are reported on stderr, one line each."""
+    (sample_project_structure / "image.png").write_bytes(b"\x89PNG")
+    (sample_project_structure / "src" / "latin1.txt").write_bytes(b"caf\xe9")
+
+    create_codebase_markdown(str(sample_project_structure), str(temp_dir / "out.md"), "")
+
+    captured = capsys.readouterr()
+    assert "probably binary" not in captured.out
+    warnings = captured.err.splitlines()
+    assert len(warnings) == 2
+    assert "'image.png'" in warnings[0]
+    assert "latin1.txt" in warnings[1]
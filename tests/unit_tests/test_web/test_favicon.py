@@ -11,7 +11,7 @@ def test_web_module_imports():
     from super_pocket.web import convert_to_favicon, DEFAULT_FAVICON_SIZES
 
     assert callable(convert_to_favicon)
-    assert isinstance(DEFAULT_FAVICON_SIZES, list)
+    assert isinstance(DEFAULT_FAVICON_SIZES, tuple)
     assert len(DEFAULT_FAVICON_SIZES) == 6
 
 
@@ -19,14 +19,14 @@ def test_favicon_default_sizes():
     """Test that default favicon sizes are correct."""
     from super_pocket.web import DEFAULT_FAVICON_SIZES
 
-    expected_sizes = [
+    expected_sizes = (
         (256, 256),
         (128, 128),
         (64, 64),
         (48, 48),
         (32, 32),
         (16, 16)
-    ]
+    )
 
     assert DEFAULT_FAVICON_SIZES == expected_sizes
 
@@ -55,5 +55,117 @@ def test_favicon_converter_invalid_output_extension(temp_dir):
         convert_to_favicon(input_file, output_file)
 
 
+def test_favicon_converter_writes_all_sizes(temp_dir):
+    """Test that every requested size ends up in the generated favicon."""
+    pil_image = pytest.importorskip("PIL.Image")
+    from super_pocket.web.favicon import convert_to_favicon
+
+    input_file = temp_dir / "logo.png"
+    pil_image.new("RGBA", (512, 512), (255, 0, 0, 255)).save(input_file)
+    output_file = temp_dir / "favicon.ico"
+
+    convert_to_favicon(input_file, output_file, [(64, 64), (32, 32), (16, 16)])
+
+    with pil_image.open(output_file) as ico:
+        assert ico.info["sizes"] == {(64, 64), (32, 32), (16, 16)}
+
+
+def test_favicon_converter_non_square_source(temp_dir):
+    """Test that non-square sources keep their aspect ratio, as Pillow's encoder does."""
+    pil_image = pytest.importorskip("PIL.Image")
+    from super_pocket.web.favicon import (
+        DEFAULT_FAVICON_SIZES,
+        convert_to_favicon,
+    )
+
+    input_file = temp_dir / "logo.png"
+    pil_image.new("RGBA", (512, 256), (255, 0, 0, 255)).save(input_file)
+    output_file = temp_dir / "favicon.ico"
+    reference_file = temp_dir / "reference.ico"
+
+    convert_to_favicon(input_file, output_file)
+    with pil_image.open(input_file) as source:
+        source.save(reference_file, format="ICO", sizes=DEFAULT_FAVICON_SIZES)
+
+    with pil_image.open(output_file) as ico, pil_image.open(reference_file) as reference:
+        assert ico.info["sizes"] == {
+            (256, 128), (128, 64), (64, 32), (48, 24), (32, 16), (16, 8)
+        }
+        assert ico.info["sizes"] == reference.info["sizes"]
+
+
+def test_favicon_converter_palette_image(temp_dir):
+    """Test converting a palette (P mode) image keeps transparency support."""
+    pil_image = pytest.importorskip("PIL.Image")
+    from super_pocket.web.favicon import convert_to_favicon
+
+    input_file = temp_dir / "logo.png"
+    pil_image.new("RGB", (64, 64), (0, 0, 255)).convert("P").save(input_file)
+    output_file = temp_dir / "favicon.ico"
+
+    convert_to_favicon(input_file, output_file, [(32, 32), (16, 16)])
+
+    with pil_image.open(output_file) as ico:
+        ico.size = (32, 32)
+        ico.load()
+        assert ico.mode == "RGBA"
+
+
+def test_favicon_convert_default_output(temp_dir):
+    """Test that the favicon is written to the working directory by default."""
+    pil_image = pytest.importorskip("PIL.Image")
+    from click.testing import CliRunner
+
+    from super_pocket.web.favicon import favicon_convert
+
+    input_file = temp_dir / "logo.png"
+    pil_image.new("RGBA", (64, 64)).save(input_file)
+
+    runner = CliRunner()
+    with runner.isolated_filesystem(temp_dir=temp_dir) as cwd:
+        result = runner.invoke(favicon_convert, [str(input_file)])
+
+        assert result.exit_code == 0
+        assert (Path(cwd) / "favicon.ico").exists()
+
+
+def test_favicon_convert_adds_ico_extension(temp_dir):
+    """Test that an output path without .ico gets the extension added."""
+    pil_image = pytest.importorskip("PIL.Image")
+    from click.testing import CliRunner
+
+    from super_pocket.web.favicon import favicon_convert
+
+    input_file = temp_dir / "logo.png"
+    pil_image.new("RGBA", (64, 64)).save(input_file)
+
+    result = CliRunner().invoke(
+        favicon_convert,
+        [str(input_file), '-o', str(temp_dir / "icon.png")]
+    )
+
+    assert result.exit_code == 0
+    assert (temp_dir / "icon.ico").exists()
+
+
+@pytest.mark.parametrize("sizes", ["64", "64x64,axb", "64x64x64"])
+def test_favicon_convert_invalid_sizes(temp_dir, sizes):
+    """Test that malformed --sizes values abort the command."""
+    from click.testing import CliRunner
+
+    from super_pocket.web.favicon import favicon_convert
+
+    input_file = temp_dir / "logo.png"
+    input_file.write_text("dummy", encoding='utf-8')
+
+    result = CliRunner().invoke(
+        favicon_convert,
+        [str(input_file), '-o', str(temp_dir / "favicon.ico"), '--sizes', sizes]
+    )
+
+    assert result.exit_code == 1
+    assert "Invalid size format" in result.output
+
+
 # Note: Full conversion tests require Pillow dependency
 # These are skipped if Pillow is not installed